@@ -1,29 +1,38 @@
-"""Contains SQL Dialects."""
+"""Contains SQL Dialects.
 
-from typing import NamedTuple
+NB: Individual dialect modules are imported on demand rather than up
+front, because loading a dialect means building its full grammar. Most
+invocations only ever use one dialect, so we shouldn't pay for all of
+them at import time.
+"""
 
-from sqlfluff.core.dialects.dialect_ansi import ansi_dialect
-from sqlfluff.core.dialects.dialect_bigquery import bigquery_dialect
-from sqlfluff.core.dialects.dialect_mysql import mysql_dialect
-from sqlfluff.core.dialects.dialect_teradata import teradata_dialect
-from sqlfluff.core.dialects.dialect_postgres import postgres_dialect
-from sqlfluff.core.dialects.dialect_snowflake import snowflake_dialect
-from sqlfluff.core.dialects.dialect_exasol import exasol_dialect
-from sqlfluff.core.dialects.dialect_exasol_fs import exasol_fs_dialect
+from importlib import import_module
+from typing import NamedTuple
 
+# The ansi dialect is the base dialect, which every other dialect
+# module imports anyway, so we load it eagerly and re-export it here.
+from sqlfluff.core.dialects.dialect_ansi import ansi_dialect  # noqa: F401
 
+# Mapping of dialect label to the module and attribute it lives in.
 _dialect_lookup = {
-    "ansi": ansi_dialect,
-    "bigquery": bigquery_dialect,
-    "mysql": mysql_dialect,
-    "teradata": teradata_dialect,
-    "postgres": postgres_dialect,
-    "snowflake": snowflake_dialect,
-    "exasol": exasol_dialect,
-    "exasol_fs": exasol_fs_dialect,
+    "ansi": ("dialect_ansi", "ansi_dialect"),
+    "bigquery": ("dialect_bigquery", "bigquery_dialect"),
+    "mysql": ("dialect_mysql", "mysql_dialect"),
+    "teradata": ("dialect_teradata", "teradata_dialect"),
+    "postgres": ("dialect_postgres", "postgres_dialect"),
+    "snowflake": ("dialect_snowflake", "snowflake_dialect"),
+    "exasol": ("dialect_exasol", "exasol_dialect"),
+    "exasol_fs": ("dialect_exasol_fs", "exasol_fs_dialect"),
 }
 
 
+def _load_dialect(label):
+    """Import (if necessary) and return the dialect with this label."""
+    module_name, attr_name = _dialect_lookup[label]
+    module = import_module("sqlfluff.core.dialects.{0}".format(module_name))
+    return getattr(module, attr_name)
+
+
 class DialectTuple(NamedTuple):
     """Dialect Tuple object for describing dialects."""
 
@@ -35,7 +44,7 @@ class DialectTuple(NamedTuple):
 def dialect_readout():
     """Generate a readout of available dialects."""
     for dialect_label in _dialect_lookup:
-        d = _dialect_lookup[dialect_label]
+        d = _load_dialect(dialect_label)
         yield DialectTuple(
             label=dialect_label,
             name=d.name,
@@ -43,10 +52,20 @@ def dialect_readout():
         )
 
 
+# Expanded dialects, keyed by label. Expanding a dialect is expensive
+# so we only ever do it once per dialect per process.
+_expanded_dialects = {}
+
+
 def dialect_selector(s):
-    """Return a dialect given its name."""
+    """Return an expanded dialect given its name."""
     s = s or "ansi"
-    dialect = _dialect_lookup[s]
-    # Expand any callable references at this point.
-    dialect.expand()
-    return dialect
+    try:
+        return _expanded_dialects[s]
+    except KeyError:
+        # Expand any callable references at this point. This returns
+        # a copy, leaving the module level dialect unexpanded so that
+        # sub-dialects can still derive from it.
+        dialect = _load_dialect(s).expand()
+        _expanded_dialects[s] = dialect
+        return dialect
@@ -1,7 +1,25 @@
 """Defines the base dialect class."""
 
+from sys import intern
+
 from sqlfluff.core.parser import KeywordSegment, SegmentGenerator
 
+# A cache of generated keyword segment classes, keyed by keyword.
+# Dialects share most of their keywords, and generating a class is
+# much more expensive than a dict lookup, so the classes are shared
+# across dialect expansions.
+_keyword_segment_cache = {}
+
+
+def _make_keyword_segment(kw):
+    """Fetch (or generate and cache) a keyword segment class."""
+    try:
+        return _keyword_segment_cache[kw]
+    except KeyError:
+        seg = KeywordSegment.make(kw.lower())
+        _keyword_segment_cache[kw] = seg
+        return seg
+
 
 class Dialect:
     """Serves as the basis for runtime resolution of Grammar.
@@ -19,6 +37,7 @@ class Dialect:
         lexer_struct=None,
         library=None,
         sets=None,
+        inherited_sets=None,
         inherits_from=None,
         root_segment_name=None,
     ):
@@ -27,6 +46,11 @@ class Dialect:
         self.lexer_struct = lexer_struct
         self.expanded = False
         self._sets = sets or {}
+        # Sets inherited from a parent dialect via `copy_as`. These are
+        # shared (not copied) until first accessed through `sets`, at
+        # which point they're cloned into _sets so they can be mutated
+        # independently.
+        self._inherited_sets = inherited_sets or {}
         self.inherits_from = inherits_from
         self.root_segment_name = root_segment_name
 
@@ -39,28 +63,51 @@ class Dialect:
         This must be called before using the dialect. But
         allows more flexible definitions to happen at runtime.
 
+        NB: This method returns a copy of the dialect rather than
+        mutating it in place, so that the unexpanded dialect remains
+        available for sub-dialects to derive from later (dialect
+        modules are only imported on demand).
+
+        Returns:
+            :obj:`Dialect`: A copy of this dialect with any callable
+                references expanded.
+
         """
-        # Are we already expanded?
+        # Are we already expanded? Then there's nothing to do.
         if self.expanded:
-            return
+            return self
+        expanded_copy = self.copy_as(name=self.name)
+        # copy_as assumes it's making a sub-dialect, so put the
+        # inheritance record back as it was.
+        expanded_copy.inherits_from = self.inherits_from
         # Expand any callable elements of the dialect.
-        for key in self._library:
-            if isinstance(self._library[key], SegmentGenerator):
+        for key in expanded_copy._library:
+            if isinstance(expanded_copy._library[key], SegmentGenerator):
                 # If the element is callable, call it passing the current
                 # dialect and store the result in its place.
                 # Use the .replace() method for its error handling.
-                self.replace(**{key: self._library[key].expand(self)})
+                expanded_copy.replace(
+                    **{key: expanded_copy._library[key].expand(expanded_copy)}
+                )
         # Expand any keyword sets.
         for keyword_set in [
             "unreserved_keywords",
             "reserved_keywords",
         ]:  # e.g. reserved_keywords, (JOIN, ...)
             # Make sure the values are available as KeywordSegments
-            for kw in self.sets(keyword_set):
+            for kw in expanded_copy.sets(keyword_set):
                 n = kw.capitalize() + "KeywordSegment"
-                if n not in self._library:
-                    self._library[n] = KeywordSegment.make(kw.lower())
-        self.expanded = True
+                if n not in expanded_copy._library:
+                    expanded_copy._library[n] = _make_keyword_segment(kw)
+            # Once expanded, the keyword sets are read-only, so freeze
+            # them and intern the keywords themselves. Segment raws are
+            # interned too, so membership checks against these sets hit
+            # the pointer-equality fast path.
+            expanded_copy._sets[keyword_set] = frozenset(
+                intern(kw) for kw in expanded_copy.sets(keyword_set)
+            )
+        expanded_copy.expanded = True
+        return expanded_copy
 
     def sets(self, label):
         """Allows access to sets belonging to this dialect.
@@ -71,7 +118,12 @@ class Dialect:
 
         """
         if label not in self._sets:
-            self._sets[label] = set()
+            if label in self._inherited_sets:
+                # Copy-on-write: clone the inherited set on first access
+                # so it can be mutated without affecting the parent.
+                self._sets[label] = self._inherited_sets[label].copy()
+            else:
+                self._sets[label] = set()
         return self._sets[label]
 
     def copy_as(self, name):
@@ -80,16 +132,14 @@ class Dialect:
         This is the primary method for inheritance, after which, the
         `replace` method can be used to override particular rules.
         """
-        # Copy sets if they are passed, so they can be mutated independently
-        new_sets = {}
-        for label in self._sets:
-            new_sets[label] = self._sets[label].copy()
-
         return self.__class__(
             name=name,
             library=self._library.copy(),
             lexer_struct=self.lexer_struct.copy(),
-            sets=new_sets,
+            # Rather than copying the sets up front, the new dialect
+            # shares them and clones each one lazily on first access.
+            # Most sub-dialects only ever touch a couple of them.
+            inherited_sets={**self._inherited_sets, **self._sets},
             inherits_from=self.name,
             root_segment_name=self.root_segment_name,
         )
@@ -1668,20 +1668,15 @@ class TransactionStatementSegment(BaseSegment):
     """A `COMMIT` or `ROLLBACK` statement."""
 
     type = "transaction_statement"
-    match_grammar = OneOf(
-        # COMMIT [ WORK ] [ AND [ NO ] CHAIN ]
-        Sequence(
-            "COMMIT",
-            Ref.keyword("WORK", optional=True),
-            Sequence("AND", Ref.keyword("NO", optional=True), "CHAIN", optional=True),
-        ),
-        # NOTE: "TO SAVEPOINT" is not yet supported
-        # ROLLBACK [ WORK ] [ AND [ NO ] CHAIN ]
-        Sequence(
-            "ROLLBACK",
-            Ref.keyword("WORK", optional=True),
-            Sequence("AND", Ref.keyword("NO", optional=True), "CHAIN", optional=True),
-        ),
+    # COMMIT [ WORK ] [ AND [ NO ] CHAIN ]
+    # ROLLBACK [ WORK ] [ AND [ NO ] CHAIN ]
+    # NOTE: "TO SAVEPOINT" is not yet supported
+    # NB: The initial keyword is factored out so that the shared
+    # tail is only defined (and matched) once.
+    match_grammar = Sequence(
+        OneOf("COMMIT", "ROLLBACK"),
+        Ref.keyword("WORK", optional=True),
+        Sequence("AND", Ref.keyword("NO", optional=True), "CHAIN", optional=True),
     )
 
 
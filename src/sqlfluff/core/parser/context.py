@@ -36,8 +36,19 @@ class RootParseContext:
         self.indentation_config = indentation_config or {}
         # Initialise the blacklist
         self.blacklist = ParseBlacklist()
+        # A cache of the hydrated bracket matchers for this dialect.
+        # Lazily populated by BaseGrammar._bracket_pairs_from_dialect,
+        # because the bracket sets are fixed for the life of this
+        # context.
+        self._bracket_pairs_cache = None
         # This is the logger that child objects will latch onto.
         self.logger = parser_logger
+        # Cache the logging thresholds up front, so that the matching
+        # hot path can skip building log objects entirely when they
+        # wouldn't be emitted. Matching logs on every call, so even
+        # constructing the late-bound log objects is significant.
+        self.log_info = self.logger.isEnabledFor(logging.INFO)
+        self.log_debug = self.logger.isEnabledFor(logging.DEBUG)
         # A uuid for this parse context to enable cache invalidation
         self.uuid = uuid.uuid4()
 
@@ -125,10 +136,17 @@ class ParseContext:
             )
 
     def _copy(self):
-        """Mimic the copy.copy() method but restrict only to local vars."""
+        """Mimic the copy.copy() method but restrict only to local vars.
+
+        The attributes are assigned directly rather than looping over
+        __slots__, because context copies happen on almost every match
+        and the getattr/setattr indirection is measurable there.
+        """
         ctx = self.__class__(root_ctx=self._root_ctx)
-        for key in self.__slots__:
-            setattr(ctx, key, getattr(self, key))
+        ctx.match_depth = self.match_depth
+        ctx.parse_depth = self.parse_depth
+        ctx.match_segment = self.match_segment
+        ctx.recurse = self.recurse
         return ctx
 
     def __enter__(self):
@@ -173,10 +191,18 @@ class ParseContext:
 
 
 class ParseBlacklist:
-    """Acts as a cache to stop unnecessary matching."""
+    """Acts as a cache to stop unnecessary matching.
+
+    As well as the blacklist of known failures, this also holds a
+    packrat-style memo of known *successful* matches, keyed the same
+    way. Both caches are cleared together at the start of each parse
+    step because the segment ids they key on are only stable within
+    a single match cycle.
+    """
 
     def __init__(self):
         self._blacklist_struct = {}
+        self._match_memo = {}
 
     def _hashed_version(self):
         return {
@@ -202,6 +228,18 @@ class ParseBlacklist:
         else:
             self._blacklist_struct[seg_name] = {seg_tuple}
 
+    def lookup_match(self, seg_name, seg_tuple):
+        """Fetch any previous successful match of seg_tuple against seg_name.
+
+        Returns None if we haven't matched this combination before.
+        """
+        return self._match_memo.get((seg_name, seg_tuple))
+
+    def memoize_match(self, seg_name, seg_tuple, match):
+        """Remember a successful match of seg_tuple against seg_name."""
+        self._match_memo[(seg_name, seg_tuple)] = match
+
     def clear(self):
         """Clear the blacklist struct."""
         self._blacklist_struct = {}
+        self._match_memo = {}
@@ -48,59 +48,67 @@ class AnyNumberOf(BaseGrammar):
         """
         return self.optional or self.min_times == 0
 
-    def _prune_options(
-        self, segments: Tuple[BaseSegment, ...], parse_context: ParseContext
-    ) -> Tuple[List[MatchableType], List[str]]:
-        """Use the simple matchers to prune which options to match on."""
-        str_buff = [segment.raw_upper for segment in self._iter_raw_segs(segments)]
-
-        available_options = []
-        simple_opts = []
-        prune_buff = []
-        non_simple = 0
-        pruned_simple = 0
-        matched_simple = 0
-
-        # Find the first code element to match against.
-        first_elem = None
-        for elem in str_buff:
-            if elem.strip():
-                first_elem = elem
-                break
+    @cached_method_for_parse_context
+    def _simple_dispatch(
+        self, parse_context: ParseContext
+    ) -> Tuple[Tuple[int, ...], dict]:
+        """Pre-sort our elements by their simple options for fast pruning.
 
-        for opt in self._elements:
+        Returns a tuple of the indices of any non-simple elements (which
+        always require a full match) and a dict mapping each uppercase
+        simple option to the indices of the elements it could match. Both
+        refer into self._elements so that ordering can be preserved when
+        pruning. This only depends on the dialect, so we cache it against
+        the parse context rather than rebuilding it for every match.
+        """
+        non_simple = []
+        dispatch = {}
+        for idx, opt in enumerate(self._elements):
             simple = opt.simple(parse_context=parse_context)
             if simple is None:
                 # This element is not simple, we have to do a
                 # full match with it...
-                available_options.append(opt)
-                non_simple += 1
+                non_simple.append(idx)
                 continue
-            # Otherwise we have a simple option, so let's use
-            # it for pruning.
+            # Otherwise we have a simple option, so file it under
+            # each of its simple strings for dispatch.
             for simple_opt in simple:
                 # Check it's not a whitespace option
                 if not simple_opt.strip():
                     raise NotImplementedError(
                         "_prune_options not supported for whitespace matching."
                     )
-                # We want to know if the first meaningful element of the str_buff
-                # matches the option.
-                if simple_opt in str_buff:
-                    # match the FIRST non-whitespace element of the list.
-                    if first_elem != simple_opt:
-                        # No match, carry on.
-                        continue
-                    # If we get here, it's matched the FIRST element of the string buffer.
-                    available_options.append(opt)
-                    simple_opts.append(simple_opt)
-                    matched_simple += 1
-                    break
-            else:
-                # Ditch this option, the simple match has failed
-                prune_buff.append(opt)
-                pruned_simple += 1
-                continue
+                dispatch.setdefault(simple_opt, []).append(idx)
+        return tuple(non_simple), dispatch
+
+    def _prune_options(
+        self, segments: Tuple[BaseSegment, ...], parse_context: ParseContext
+    ) -> Tuple[List[MatchableType], List[str]]:
+        """Use the simple matchers to prune which options to match on."""
+        # Find the first code element to match against. Only the first
+        # meaningful raw segment matters for pruning, so we stop there
+        # rather than unpacking the whole forward buffer (which can be
+        # very long at shallow parse depths).
+        first_elem = None
+        for segment in self._iter_raw_segs(segments):
+            raw = segment.raw_upper
+            if raw.strip():
+                first_elem = raw
+                break
+
+        # Simple options either match the first meaningful element
+        # of the forward segments, or they're pruned. Non-simple
+        # options always make the cut.
+        non_simple, dispatch = self._simple_dispatch(parse_context=parse_context)
+        matched = dispatch.get(first_elem, ())
+        keep = set(non_simple).union(matched)
+        available_options = [
+            opt for idx, opt in enumerate(self._elements) if idx in keep
+        ]
+        simple_opts = [first_elem] * len(matched)
+        prune_buff = [
+            opt for idx, opt in enumerate(self._elements) if idx not in keep
+        ]
 
         parse_match_logging(
             self.__class__.__name__,
@@ -108,9 +116,9 @@ class AnyNumberOf(BaseGrammar):
             "PRN",
             parse_context=parse_context,
             v_level=3,
-            ns=non_simple,
-            ps=pruned_simple,
-            ms=matched_simple,
+            ns=len(non_simple),
+            ps=len(prune_buff),
+            ms=len(matched),
             pruned=prune_buff,
             opts=available_options or "ALL",
         )
@@ -221,3 +229,48 @@ class OneOf(AnyNumberOf):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, max_times=1, min_times=1, **kwargs)
+        # The options of a OneOf within a OneOf are just options of
+        # the outer one, so inline any compatible nested ones. NB: An
+        # inner `exclude` can't be preserved by flattening, so those
+        # stay nested.
+        flattened = []
+        for elem in self._elements:
+            if (
+                type(elem) is OneOf
+                and not elem.optional
+                and elem.exclude is None
+                and elem.allow_gaps == self.allow_gaps
+                and elem.ephemeral_segment is None
+            ):
+                flattened.extend(elem._elements)
+            else:
+                flattened.append(elem)
+        self._elements = tuple(flattened)
+
+    @match_wrapper()
+    def match(
+        self, segments: Tuple[BaseSegment, ...], parse_context: ParseContext
+    ) -> MatchResult:
+        """Match any of the elements given once.
+
+        This is a specialised version of AnyNumberOf.match for the
+        single-match case. OneOf is by far the most commonly matched
+        grammar, so skipping the repeat-matching loop (and its gap
+        handling, which never applies on the first match) is worthwhile.
+        """
+        # First if we have an *exclude* option, we should check that
+        # which would prevent the rest of this grammar from matching.
+        if self.exclude:
+            with parse_context.deeper_match() as ctx:
+                if self.exclude.match(segments, parse_context=ctx):
+                    return MatchResult.from_unmatched(segments)
+
+        # Is there anything to match against?
+        if len(segments) == 0:
+            return MatchResult.from_unmatched(segments)
+
+        match = self._match_once(segments, parse_context=parse_context)
+        if match:
+            return match
+        else:
+            return MatchResult.from_unmatched(segments)
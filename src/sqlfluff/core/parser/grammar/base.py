@@ -21,6 +21,18 @@ from sqlfluff.core.parser.context import ParseContext
 MatchableType = Union[Matchable, Type[BaseSegment]]
 
 
+class BracketInfo(NamedTuple):
+    """BracketInfo tuple for keeping track of brackets during matching.
+
+    This is used in `_bracket_sensitive_look_ahead_match` but defined here
+    at module level so the class is only created once rather than on
+    every call.
+    """
+
+    bracket: BaseSegment
+    is_definite: bool
+
+
 def cached_method_for_parse_context(func):
     """A decorator to cache the output of this method for a given parse context.
 
@@ -62,21 +74,19 @@ class BaseGrammar(Matchable):
     @staticmethod
     def _resolve_ref(elem):
         """Resolve potential string references to things we can match against."""
-        initialisers = [
-            # t: instance / f: class, ref, func
-            (True, str, Ref.keyword),
-            (True, BaseGrammar, lambda x: x),
-            (False, BaseSegment, lambda x: x),
-        ]
         # Get-out clause for None
         if elem is None:
             return None
-
-        for instance, init_type, init_func in initialisers:
-            if (instance and isinstance(elem, init_type)) or (
-                not instance and issubclass(elem, init_type)
-            ):
-                return init_func(elem)
+        # Strings are a shortcut to a keyword reference. NB: Ref.keyword
+        # returns a cached instance, so repeated mentions of the same
+        # keyword across grammars share a single Ref.
+        if isinstance(elem, str):
+            return Ref.keyword(elem)
+        # Grammar instances and segment classes can be matched directly.
+        if isinstance(elem, BaseGrammar):
+            return elem
+        if isinstance(elem, type) and issubclass(elem, BaseSegment):
+            return elem
         raise TypeError(
             "Grammar element [{0!r}] was found of unexpected type [{1}] was found.".format(
                 elem, type(elem)
@@ -114,10 +124,11 @@ class BaseGrammar(Matchable):
         # We provide a common interface for any grammar that allows positional elements.
         # If *any* for the elements are a string and not a grammar, then this is a shortcut
         # to the Ref.keyword grammar by default.
+        # NB: Elements are stored as a tuple. Grammars are constructed once
+        # and then matched against many times, so an immutable, compact
+        # layout is preferable to a list.
         if self.allow_keyword_string_refs:
-            self._elements = []
-            for elem in args:
-                self._elements.append(self._resolve_ref(elem))
+            self._elements = tuple(self._resolve_ref(elem) for elem in args)
         else:
             self._elements = args
 
@@ -147,6 +158,33 @@ class BaseGrammar(Matchable):
         """
         return self.optional
 
+    def _flatten_nested(self, grammar_cls):
+        """Inline the elements of directly nested grammars of a given type.
+
+        For associative grammars (e.g. a Sequence directly inside a
+        Sequence, or a OneOf directly inside a OneOf), the nesting adds
+        a layer of match calls without changing what's matched, so we
+        flatten it at construction time. We only do this where the
+        inner grammar is exactly the given class (subclasses may add
+        behaviour) and has no configuration of its own which the
+        nesting preserves.
+        """
+        flattened = []
+        for elem in self._elements:
+            if (
+                type(elem) is grammar_cls
+                and not elem.optional
+                and elem.allow_gaps == self.allow_gaps
+                and elem.ephemeral_segment is None
+            ):
+                flattened.extend(elem._elements)
+            else:
+                flattened.append(elem)
+        # NB: Rebinding here means any ephemeral copy made during
+        # __init__ keeps the unflattened elements, which is fine
+        # because flattening doesn't change what's matched.
+        self._elements = tuple(flattened)
+
     @match_wrapper()
     def match(self, segments: Tuple["BaseSegment", ...], parse_context: ParseContext):
         """Match a list of segments against this segment.
@@ -236,7 +274,7 @@ class BaseGrammar(Matchable):
         return MatchResult.from_unmatched(segments), None
 
     @classmethod
-    def _look_ahead_match(cls, segments, matchers, parse_context):
+    def _look_ahead_match(cls, segments, matchers, parse_context, raw_upper_buff=None):
         """Look ahead for matches beyond the first element of the segments list.
 
         This function also contains the performance improved hash-matching approach to
@@ -246,6 +284,11 @@ class BaseGrammar(Matchable):
         If two matches of the same length match at the same time, then it's the first in
         the iterable of matchers.
 
+        If `raw_upper_buff` is provided, it should be a list of the raw_upper
+        values of `segments`, allowing callers which scan repeatedly over
+        suffixes of the same buffer (i.e. the bracket sensitive version of
+        this method) to avoid rebuilding it each time.
+
         Returns:
             `tuple` of (unmatched_segments, match_object, matcher).
 
@@ -286,24 +329,32 @@ class BaseGrammar(Matchable):
         if simple_matchers:
             # If they're all simple we can use a hash match to identify the first one.
             # Build a buffer of all the upper case raw segments ahead of us.
-            str_buff = []
             # For existing compound segments, we should assume that within
             # that segment, things are internally consistent, that means
             # rather than enumerating all the individual segments of a longer
             # one we just dump out the whole segment. This is a) faster and
             # also b) prevents some really horrible bugs with bracket matching.
             # See https://github.com/sqlfluff/sqlfluff/issues/433
-            str_buff = [seg.raw_upper for seg in segments]
+            if raw_upper_buff is not None:
+                str_buff = raw_upper_buff
+            else:
+                str_buff = [seg.raw_upper for seg in segments]
             match_queue = []
 
+            # Record the first occurrence of each element of the buffer
+            # in a single pass, rather than scanning the whole buffer
+            # once per simple option with `.index`.
+            first_positions = {}
+            for buff_pos, elem in enumerate(str_buff):
+                if elem not in first_positions:
+                    first_positions[elem] = buff_pos
+
             for matcher, simple in simple_matchers:
                 # Simple will be a tuple of options
                 for simple_option in simple:
-                    try:
-                        buff_pos = str_buff.index(simple_option)
+                    buff_pos = first_positions.get(simple_option)
+                    if buff_pos is not None:
                         match_queue.append((matcher, buff_pos, simple_option))
-                    except ValueError:
-                        pass
 
             # Sort the match queue. First to process AT THE END.
             # That means we pop from the end.
@@ -419,6 +470,34 @@ class BaseGrammar(Matchable):
                 pre_seg_buff += (seg_buff[0],)
                 seg_buff = seg_buff[1:]
 
+    @staticmethod
+    def _bracket_pairs_from_dialect(parse_context):
+        """Fetch the hydrated bracket matchers for this parse context.
+
+        We get them from the relevant set on the dialect. We use zip
+        twice to "unzip" them. We ignore the first argument because
+        that's just the name. The entries in the set are strings which
+        need rehydrating through the dialect, which is expensive enough
+        that we only do it once per parse context and cache the result
+        on the root context.
+
+        Returns:
+            `tuple` of (start_brackets, end_brackets, definitely_bracket).
+
+        """
+        cached = parse_context._bracket_pairs_cache
+        if cached is None:
+            _, start_bracket_refs, end_bracket_refs, definitely_bracket = zip(
+                *parse_context.dialect.sets("bracket_pairs")
+            )
+            cached = (
+                [parse_context.dialect.ref(seg_ref) for seg_ref in start_bracket_refs],
+                [parse_context.dialect.ref(seg_ref) for seg_ref in end_bracket_refs],
+                list(definitely_bracket),
+            )
+            parse_context._root_ctx._bracket_pairs_cache = cached
+        return cached
+
     @classmethod
     def _bracket_sensitive_look_ahead_match(
         cls, segments, matchers, parse_context, start_bracket=None, end_bracket=None
@@ -432,11 +511,6 @@ class BaseGrammar(Matchable):
             `tuple` of (unmatched_segments, match_object, matcher).
 
         """
-
-        class BracketInfo(NamedTuple):
-            bracket: BaseSegment
-            is_definite: bool
-
         # Type munging
         matchers = list(matchers)
         if isinstance(segments, BaseSegment):
@@ -447,40 +521,41 @@ class BaseGrammar(Matchable):
             return ((), MatchResult.from_unmatched(segments), None)
 
         # Get hold of the bracket matchers from the dialect, and append them
-        # to the list of matchers. We get them from the relevant set on the
-        # dialect. We use zip twice to "unzip" them. We ignore the first
-        # argument because that's just the name.
-        _, start_bracket_refs, end_bracket_refs, definitely_bracket = zip(
-            *parse_context.dialect.sets("bracket_pairs")
+        # to the list of matchers.
+        start_brackets, end_brackets, definitely_bracket = (
+            cls._bracket_pairs_from_dialect(parse_context)
         )
-        # These are currently strings which need rehydrating
-        start_brackets = [
-            parse_context.dialect.ref(seg_ref) for seg_ref in start_bracket_refs
-        ]
-        end_brackets = [
-            parse_context.dialect.ref(seg_ref) for seg_ref in end_bracket_refs
-        ]
         start_definite = list(definitely_bracket)
         end_definite = list(definitely_bracket)
-        # Add any bracket-like things passed as arguments
+        # Add any bracket-like things passed as arguments. NB: We use `+`
+        # rather than `+=` here so that we don't mutate the cached lists.
         if start_bracket:
-            start_brackets += [start_bracket]
+            start_brackets = start_brackets + [start_bracket]
             start_definite += [True]
         if end_bracket:
-            end_brackets += [end_bracket]
+            end_brackets = end_brackets + [end_bracket]
             end_definite += [True]
         bracket_matchers = start_brackets + end_brackets
+        look_ahead_matchers = matchers + bracket_matchers
 
         # Make some buffers
         seg_buff = segments
         pre_seg_buff = ()  # NB: Tuple
         bracket_stack: List[BracketInfo] = []
+        # Build the raw_upper buffer for the whole forward view once.
+        # Each iteration of the loop below scans a suffix of the same
+        # segments, so we slice this buffer rather than rebuilding it.
+        raw_upper_buff = [seg.raw_upper for seg in segments]
 
         # Iterate
         while True:
             # Do we have anything left to match on?
             if seg_buff:
                 # Yes we have buffer left to work with.
+                # The unmatched segments returned by _look_ahead_match are
+                # always a suffix of what was passed in, so the offset into
+                # the raw_upper buffer is just the length difference.
+                buff_offset = len(segments) - len(seg_buff)
                 # Are we already in a bracket stack?
                 if bracket_stack:
                     # Yes, we're just looking for the closing bracket, or
@@ -489,6 +564,9 @@ class BaseGrammar(Matchable):
                         seg_buff,
                         bracket_matchers,
                         parse_context=parse_context,
+                        raw_upper_buff=raw_upper_buff[buff_offset:]
+                        if buff_offset
+                        else raw_upper_buff,
                     )
 
                     if match:
@@ -549,8 +627,11 @@ class BaseGrammar(Matchable):
                     # that we're otherwise looking for.
                     pre, match, matcher = cls._look_ahead_match(
                         seg_buff,
-                        matchers + bracket_matchers,
+                        look_ahead_matchers,
                         parse_context=parse_context,
+                        raw_upper_buff=raw_upper_buff[buff_offset:]
+                        if buff_offset
+                        else raw_upper_buff,
                     )
 
                     if match:
@@ -640,6 +721,52 @@ class Ref(BaseGrammar):
     # and it also causes infinite recursion.
     allow_keyword_string_refs = False
 
+    # Any two Refs constructed with the same arguments are
+    # interchangeable (they hold no state other than their caches,
+    # which depend only on the dialect), and dialects construct the
+    # same handful of references thousands of times. Share a single
+    # instance per unique set of arguments so those caches are
+    # warmed once rather than per construction site. Refs with an
+    # ephemeral_name generate a fresh class on init, so they aren't
+    # shared.
+    _ref_cache = {}
+
+    def __new__(cls, *args, **kwargs):
+        # NB: The copy protocol calls __new__ with no arguments, so an
+        # argument-less call must always make a fresh instance rather
+        # than hitting the cache.
+        if not args or kwargs.get("ephemeral_name"):
+            return super().__new__(cls)
+        cache_key = (args, tuple(sorted(kwargs.items())))
+        try:
+            return cls._ref_cache[cache_key]
+        except KeyError:
+            obj = super().__new__(cls)
+            cls._ref_cache[cache_key] = obj
+            return obj
+
+    def __init__(self, *args, **kwargs):
+        # A cache of the elements we resolve to, keyed by dialect
+        # name. Resolution is stable once a dialect has been expanded
+        # so we only ever need to do the lookup through the dialect
+        # name table once per dialect. NB: We set this before calling
+        # the parent init, because that may copy this object in the
+        # process of making an ephemeral segment.
+        self._elem_cache = {}
+        # Validate and store the name we reference once up front,
+        # rather than re-validating on every match call. Unusually for
+        # a grammar we expect the elements to be a list of strings.
+        # Notably ONE string for now. NB: Like the cache above, this
+        # must be set before the parent init for the same reason.
+        if len(args) != 1:
+            raise ValueError(
+                "Ref grammar can only deal with precisely one element for now. Instead found {0!r}".format(
+                    args
+                )
+            )
+        self._ref = args[0]
+        super().__init__(*args, **kwargs)
+
     @cached_method_for_parse_context
     def simple(self, parse_context: ParseContext) -> Optional[List[str]]:
         """Does this matcher support a uppercase hash matching route?
@@ -652,23 +779,27 @@ class Ref(BaseGrammar):
 
     def _get_ref(self):
         """Get the name of the thing we're referencing."""
-        # Unusually for a grammar we expect _elements to be a list of strings.
-        # Notable ONE string for now.
-        if len(self._elements) == 1:
-            # We're good on length. Get the name of the reference
-            return self._elements[0]
-        else:
-            raise ValueError(
-                "Ref grammar can only deal with precisely one element for now. Instead found {0!r}".format(
-                    self._elements
-                )
-            )
+        # This is validated and stored in the init method.
+        return self._ref
 
     def _get_elem(self, dialect):
         """Get the actual object we're referencing."""
         if dialect:
+            # Check the cache first. Resolving a reference requires a
+            # dict lookup (and some validation) in the dialect on every
+            # call, and this is one of the hottest paths in matching, so
+            # we resolve each reference through a given dialect only once.
+            try:
+                return self._elem_cache[dialect.name]
+            except KeyError:
+                pass
             # Use the dialect to retrieve the grammar it refers to.
-            return dialect.ref(self._get_ref())
+            elem = dialect.ref(self._ref)
+            # Only cache the result once the dialect is expanded, because
+            # up to that point elements may still be replaced.
+            if dialect.expanded:
+                self._elem_cache[dialect.name] = elem
+            return elem
         else:
             raise ReferenceError("No Dialect has been provided to Ref grammar!")
 
@@ -699,9 +830,11 @@ class Ref(BaseGrammar):
         # We used to use seg_to_tuple here, but it was too slow,
         # so instead we rely on segments not being mutated within a given
         # match cycle and so the ids should continue to refer to unchanged
-        # objects.
-        seg_tuple = (id(seg) for seg in segments)
-        self_name = self._get_ref()
+        # objects. NB: This must be a real tuple (and not a generator),
+        # because generators hash by identity and so would never
+        # register as cache hits on later calls.
+        seg_tuple = tuple(id(seg) for seg in segments)
+        self_name = self._ref
         if parse_context.blacklist.check(self_name, seg_tuple):
             # This has been tried before.
             parse_match_logging(
@@ -713,12 +846,37 @@ class Ref(BaseGrammar):
                 self_name=self_name,
             )
             return MatchResult.from_unmatched(segments)
+        # ...and then against the memo of previous successes. Matching is
+        # deterministic for a given set of segments, so if we've matched
+        # here before we can reuse the result directly. This is what makes
+        # recursive structures (e.g. nested expressions) roughly linear
+        # rather than exponential to match.
+        memo = parse_context.blacklist.lookup_match(self_name, seg_tuple)
+        if memo is not None:
+            parse_match_logging(
+                self.__class__.__name__,
+                "match",
+                "MEMO",
+                parse_context=parse_context,
+                v_level=3,
+                self_name=self_name,
+            )
+            return memo
 
         # Match against that. NB We're not incrementing the match_depth here.
         # References shouldn't really count as a depth of match.
-        with parse_context.matching_segment(self._get_ref()) as ctx:
-            resp = elem.match(segments=segments, parse_context=ctx)
-        if not resp:
+        # The matching_segment context is only ever read when formatting
+        # log messages, so when the parse logger isn't enabled we skip
+        # copying the context. Refs are matched more than anything else,
+        # so the copies are significant in aggregate.
+        if parse_context.log_info:
+            with parse_context.matching_segment(self._ref) as ctx:
+                resp = elem.match(segments=segments, parse_context=ctx)
+        else:
+            resp = elem.match(segments=segments, parse_context=parse_context)
+        if resp:
+            parse_context.blacklist.memoize_match(self_name, seg_tuple, resp)
+        else:
             parse_context.blacklist.mark(self_name, seg_tuple)
         return resp
 
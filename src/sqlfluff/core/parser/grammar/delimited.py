@@ -3,6 +3,7 @@
 from typing import Tuple, List
 
 from sqlfluff.core.parser.grammar import Ref
+from sqlfluff.core.parser.helpers import trim_non_code_segments
 from sqlfluff.core.parser.segments import BaseSegment
 from sqlfluff.core.parser.match_result import MatchResult
 from sqlfluff.core.parser.match_wrapper import match_wrapper
@@ -56,6 +57,21 @@ class Delimited(OneOf):
         # delimiters is a list of tuples containing delimiter segments as we find them.
         delimiters: List[BaseSegment] = []
 
+        # The matchers we look ahead for don't change between iterations,
+        # so assemble them once rather than rebuilding them on every loop.
+        matchers = [self.delimiter]
+        if self.terminator:
+            matchers.append(self.terminator)
+        # If gaps aren't allowed, a gap (or non-code segment), acts like a terminator.
+        if not self.allow_gaps:
+            matchers.append(NonCodeMatcher())
+
+        # All the matching below happens one level deeper than this
+        # grammar. The deeper context is only ever read by the matchers,
+        # so take a single copy up front and reuse it, rather than
+        # copying the context on every iteration.
+        ctx = parse_context.deeper_match()
+
         # First iterate through all the segments, looking for the delimiter.
         # Second, split the list on each of the delimiters, and ensure that
         # each sublist in turn matches one of the elements.
@@ -82,23 +98,15 @@ class Delimited(OneOf):
 
             # We rely on _bracket_sensitive_look_ahead_match to do the bracket counting
             # element of this now. We look ahead to find a delimiter or terminator.
-            matchers = [self.delimiter]
-            if self.terminator:
-                matchers.append(self.terminator)
-            # If gaps aren't allowed, a gap (or non-code segment), acts like a terminator.
-            if not self.allow_gaps:
-                matchers.append(NonCodeMatcher())
-
-            with parse_context.deeper_match() as ctx:
-                (
-                    pre_content,
-                    delimiter_match,
-                    delimiter_matcher,
-                ) = self._bracket_sensitive_look_ahead_match(
-                    seg_buff,
-                    matchers,
-                    parse_context=ctx,
-                )
+            (
+                pre_content,
+                delimiter_match,
+                delimiter_matcher,
+            ) = self._bracket_sensitive_look_ahead_match(
+                seg_buff,
+                matchers,
+                parse_context=ctx,
+            )
             # Keep track of the *length* of this pre-content section before we start
             # to change it later. We need this for dealing with terminators.
             pre_content_len = len(pre_content)
@@ -113,13 +121,27 @@ class Delimited(OneOf):
                 # of the things we're looking for. NB: If it's of zero length then
                 # we return without trying it.
                 if len(pre_content) > 0:
-                    with parse_context.deeper_match() as ctx:
-                        match, matcher = self._longest_trimmed_match(
-                            segments=pre_content,
-                            matchers=self._elements,
-                            parse_context=ctx,
-                            trim_noncode=self.allow_gaps,
-                        )
+                    # Prune the available options to those which could feasibly
+                    # match the content. NB: We prune on the *gap trimmed*
+                    # content, because that's what we'll eventually match on and
+                    # a leading comment shouldn't disqualify simple matchers.
+                    if self.allow_gaps:
+                        _, content, _ = trim_non_code_segments(pre_content)
+                    else:
+                        content = pre_content
+                    available_options, _ = self._prune_options(
+                        content, parse_context=parse_context
+                    )
+                    # If we've pruned all the options, no match.
+                    if not available_options:
+                        return MatchResult.from_unmatched(segments)
+
+                    match, matcher = self._longest_trimmed_match(
+                        segments=pre_content,
+                        matchers=available_options,
+                        parse_context=ctx,
+                        trim_noncode=self.allow_gaps,
+                    )
 
                     # No match, or an incomplete match: Not allowed
                     if not match or not match.is_complete():
@@ -183,15 +205,28 @@ class Delimited(OneOf):
                 if self.min_delimiters and len(delimiters) < self.min_delimiters:
                     return MatchResult.from_unmatched(segments)
 
-                # We use the whitespace padded match to hoover up whitespace if enabled,
-                # and default to the longest matcher. We don't care which one matches.
-                with parse_context.deeper_match() as ctx:
+                # Prune the available options as above. If nothing survives the
+                # prune then we already know there's no match here, but we fall
+                # through rather than returning so we still handle trailing
+                # delimiters appropriately below.
+                if self.allow_gaps:
+                    _, content, _ = trim_non_code_segments(seg_buff)
+                else:
+                    content = seg_buff
+                available_options, _ = self._prune_options(
+                    content, parse_context=parse_context
+                )
+                if available_options:
+                    # We use the whitespace padded match to hoover up whitespace if enabled,
+                    # and default to the longest matcher. We don't care which one matches.
                     mat, _ = self._longest_trimmed_match(
                         seg_buff,
-                        self._elements,
+                        available_options,
                         parse_context=ctx,
                         trim_noncode=self.allow_gaps,
                     )
+                else:
+                    mat = MatchResult.from_unmatched(seg_buff)
                 if mat:
                     # We've got something at the end. Return!
                     if mat.unmatched_segments:
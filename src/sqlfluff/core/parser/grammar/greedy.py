@@ -176,6 +176,16 @@ class StartsWith(GreedyUntil):
             # We've trying to match on a sequence of segments which contain no code.
             # That means this isn't a match.
             return MatchResult.from_unmatched(segments)
+        # If our target is simple, we can check the first code token
+        # against its options directly and fail fast without invoking
+        # a full match.
+        simple = self.simple(parse_context=parse_context)
+        if simple is not None:
+            for raw_seg in segments[first_code_idx].iter_raw_seg():
+                if raw_seg.is_code:
+                    if raw_seg.raw_upper not in simple:
+                        return MatchResult.from_unmatched(segments)
+                    break
         with parse_context.deeper_match() as ctx:
             match = self.target.match(
                 segments=segments[first_code_idx:], parse_context=ctx
@@ -19,6 +19,12 @@ from sqlfluff.core.parser.grammar.base import (
 class Sequence(BaseGrammar):
     """Match a specific sequence of elements."""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # A sequence within a sequence matches the same thing as the
+        # combined sequence, so inline any compatible nested ones.
+        self._flatten_nested(Sequence)
+
     @cached_method_for_parse_context
     def simple(self, parse_context: ParseContext) -> Optional[List[str]]:
         """Does this matcher support a uppercase hash matching route?
@@ -107,6 +113,26 @@ class Sequence(BaseGrammar):
                         # required elements.
                         return MatchResult.from_unmatched(segments)
                 else:
+                    # If the element is simple, we can check the first code
+                    # token against its options up front. Most elements in a
+                    # sequence don't match at most positions, so this lets us
+                    # skip (or fail) cheaply without a full match attempt.
+                    simple = elem.simple(parse_context=parse_context)
+                    if simple is not None:
+                        first_code = None
+                        for raw_seg in self._iter_raw_segs(mid_seg):
+                            if raw_seg.is_code:
+                                first_code = raw_seg
+                                break
+                        if first_code is None or first_code.raw_upper not in simple:
+                            # The element can't match here.
+                            if elem.is_optional():
+                                # This crashes us out of the while loop and
+                                # moves us onto the next matching element.
+                                break
+                            else:
+                                return MatchResult.from_unmatched(segments)
+
                     # We've already dealt with potential whitespace above, so carry on to matching
                     with parse_context.deeper_match() as ctx:
                         elem_match = elem.match(mid_seg, parse_context=ctx)
@@ -193,8 +219,14 @@ class Bracketed(Sequence):
         start_bracket, _ = self.get_bracket_from_dialect(parse_context)
         return start_bracket.simple(parse_context=parse_context)
 
+    @cached_method_for_parse_context
     def get_bracket_from_dialect(self, parse_context):
-        """Rehydrate the bracket segments in question."""
+        """Rehydrate the bracket segments in question.
+
+        NB: This is cached against the parse context, because it's
+        called on every match attempt and the result is fixed for a
+        given dialect.
+        """
         for bracket_type, start_ref, end_ref, _ in parse_context.dialect.sets(
             "bracket_pairs"
         ):
@@ -53,6 +53,24 @@ class SingletonMatcher:
         self.target_seg_class = target_seg_class
         self.subdivide = subdivide
         self.trim_post_subdivide = trim_post_subdivide
+        # Precompile any subdivision and trim patterns (and generate the
+        # segment classes they produce) here, rather than on every match.
+        if self.subdivide:
+            self._divider_regex = re.compile(self.subdivide["regex"], re.DOTALL)
+            self._divider_class = RawSegment.make(
+                self.subdivide["regex"],
+                name=self.subdivide["name"],
+                type=self.subdivide["type"],
+            )
+        if self.trim_post_subdivide:
+            self._trimmer_regex = re.compile(
+                self.trim_post_subdivide["regex"], re.DOTALL
+            )
+            self._trim_class = RawSegment.make(
+                self.trim_post_subdivide["regex"],
+                name=self.trim_post_subdivide["name"],
+                type=self.trim_post_subdivide["type"],
+            )
 
     def _match(self, forward_string):
         """The private match function. Just look for a single character match."""
@@ -74,14 +92,9 @@ class SingletonMatcher:
         idx = 0
 
         if self.trim_post_subdivide:
-            trimmer = re.compile(self.trim_post_subdivide["regex"], re.DOTALL)
-            TrimClass = RawSegment.make(
-                self.trim_post_subdivide["regex"],
-                name=self.trim_post_subdivide["name"],
-                type=self.trim_post_subdivide["type"],
-            )
+            TrimClass = self._trim_class
 
-            for trim_mat in trimmer.finditer(matched):
+            for trim_mat in self._trimmer_regex.finditer(matched):
                 trim_span = trim_mat.span()
                 # Is it at the start?
                 if trim_span[0] == 0:
@@ -132,16 +145,11 @@ class SingletonMatcher:
             seg_buff = ()
             str_buff = matched
             pos_buff = start_pos
-            divider = re.compile(self.subdivide["regex"], re.DOTALL)
-            DividerClass = RawSegment.make(
-                self.subdivide["regex"],
-                name=self.subdivide["name"],
-                type=self.subdivide["type"],
-            )
+            DividerClass = self._divider_class
 
             while True:
                 # Iterate through subdividing as appropriate
-                mat = divider.search(str_buff)
+                mat = self._divider_regex.search(str_buff)
                 if mat:
                     # Found a division
                     span = mat.span()
@@ -244,15 +252,18 @@ class RepeatedMultiMatcher(SingletonMatcher):
 
     def match(self, forward_string, start_pos):
         """Iteratively match strings using the selection of submatchers."""
-        seg_buff = ()
+        # NB: We accumulate segments in a list here (converting on return)
+        # because appending to a list is constant time, while extending a
+        # tuple copies it, which adds up to quadratic time on long files.
+        seg_buff = []
         while True:
             if len(forward_string) == 0:
-                return LexMatch(forward_string, start_pos, seg_buff)
+                return LexMatch(forward_string, start_pos, tuple(seg_buff))
             for matcher in self.submatchers:
                 res = matcher.match(forward_string, start_pos)
                 if res.segments:
                     # If we have new segments then whoop!
-                    seg_buff += res.segments
+                    seg_buff.extend(res.segments)
                     forward_string = res.new_string
                     start_pos = res.new_pos
                     # Cycle back around again and start with the top
@@ -262,7 +273,7 @@ class RepeatedMultiMatcher(SingletonMatcher):
                     continue
             else:
                 # We've got so far, but now can't match. Return
-                return LexMatch(forward_string, start_pos, seg_buff)
+                return LexMatch(forward_string, start_pos, tuple(seg_buff))
 
     @classmethod
     def from_struct(cls, s):
@@ -315,7 +326,7 @@ class Lexer:
         package it up as unlexable and keep track of the exceptions.
         """
         start_pos = FilePositionMarker()
-        segment_buff = ()
+        segment_list = []
         violations = []
 
         # Handle potential TemplatedFile for now
@@ -323,7 +334,7 @@ class Lexer:
 
         while True:
             res = self.matcher.match(str_buff, start_pos)
-            segment_buff += res.segments
+            segment_list.extend(res.segments)
             if len(res.new_string) > 0:
                 violations.append(
                     SQLLexError(
@@ -340,10 +351,11 @@ class Lexer:
 
                 str_buff = resort_res.new_string
                 start_pos = resort_res.new_pos
-                segment_buff += resort_res.segments
+                segment_list.extend(resort_res.segments)
             else:
                 break
 
+        segment_buff = tuple(segment_list)
         # Enrich the segments if we can using the templated file
         if isinstance(raw, TemplatedFile):
             return self.enrich_segments(segment_buff, raw), violations
@@ -9,7 +9,7 @@ from typing import Optional
 class FilePositionMarker:
     """This class is a construct to keep track of positions within a file."""
 
-    slots = ["statement_index", "line_no", "line_pos", "char_pos"]
+    __slots__ = ["statement_index", "line_no", "line_pos", "char_pos"]
 
     def __init__(
         self,
@@ -98,7 +98,7 @@ class FilePositionMarker:
 class EnrichedFilePositionMarker(FilePositionMarker):
     """A more advanced file position marker which keeps track of source position."""
 
-    slots = ["templated_slice", "source_slice", "is_literal", "source_pos_marker"]
+    __slots__ = ["templated_slice", "source_slice", "is_literal", "source_pos_marker"]
 
     def __init__(
         self,
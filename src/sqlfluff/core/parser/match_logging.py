@@ -73,6 +73,10 @@ class ParseMatchLogObject(LateLoggingObject):
 
 def parse_match_logging(grammar, func, msg, parse_context, v_level=3, **kwargs):
     """Log in a particular consistent format for use while matching."""
+    # If the logger wouldn't emit at this level, don't even construct
+    # the log object.
+    if not (parse_context.log_info if v_level == 3 else parse_context.log_debug):
+        return
     # Make a late bound log object so we only do the string manipulation when we need to.
     ParseMatchLogObject(
         parse_context, grammar, func, msg, v_level=v_level, **kwargs
@@ -124,6 +124,12 @@ class MatchResult(
     @classmethod
     def from_empty(cls) -> "MatchResult":
         """Construct an empty `MatchResult`."""
+        if cls is MatchResult:
+            # Matches are immutable, so every empty match can share a
+            # single instance. Empty matches are made at the start of
+            # almost every compound match so this saves a lot of
+            # short-lived tuples.
+            return _EMPTY_MATCH
         return cls(unmatched_segments=(), matched_segments=())
 
     def __add__(self, other) -> "MatchResult":
@@ -152,3 +158,7 @@ class MatchResult(
                 matched_segments=self.matched_segments + other_tuple,
                 unmatched_segments=self.unmatched_segments,
             )
+
+
+# The shared empty match returned by `MatchResult.from_empty`.
+_EMPTY_MATCH = MatchResult(matched_segments=(), unmatched_segments=())
@@ -63,15 +63,16 @@ def match_wrapper(v_level=3):
                     )
                 )
 
-            # Log the result.
-            WrapParseMatchLogObject(
-                grammar=func.__qualname__,
-                func="match",
-                match=m,
-                parse_context=parse_context,
-                segments=segments,
-                v_level=v_level,
-            ).log()
+            # Log the result, unless the logger would discard it anyway.
+            if parse_context.log_info if v_level == 3 else parse_context.log_debug:
+                WrapParseMatchLogObject(
+                    grammar=func.__qualname__,
+                    func="match",
+                    match=m,
+                    parse_context=parse_context,
+                    segments=segments,
+                    v_level=v_level,
+                ).log()
 
             # Basic Validation, skipped here because it still happens in the parse commands.
             return m
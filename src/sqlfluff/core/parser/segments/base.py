@@ -73,6 +73,10 @@ class BaseSegment:
     optional = False  # NB: See the sequence grammar for details
     is_segment = True
     _name = None
+    # The uppercase form of the name, precomputed by `RawSegment.make`
+    # for generated classes. Matching on names falls back to upper-casing
+    # on the fly where this isn't set.
+    _name_upper = None
     is_meta = False
     # Are we able to have non-code at the start or end?
     can_start_end_non_code = False
@@ -350,18 +354,32 @@ class BaseSegment:
         """
         return cls.optional
 
+    @classmethod
+    def _class_types(cls):
+        """Return the set of types matched by this class.
+
+        That means the type of this class plus those of its parents, up
+        to (and including) any class whose type is "base". The result
+        is cached on each class, because class hierarchies don't change
+        at runtime and is_type is called extremely frequently.
+        """
+        try:
+            # NB: Check __dict__ directly so we don't pick up a cached
+            # set from a parent class.
+            return cls.__dict__["_class_types_cache"]
+        except KeyError:
+            pass
+        types = {cls.type}
+        if cls.type != "base":
+            for base_class in cls.__bases__:
+                types |= base_class._class_types()
+        cls._class_types_cache = types
+        return types
+
     @classmethod
     def is_type(cls, *seg_type):
         """Is this segment (or its parent) of the given type."""
-        # Do we match on the type of _this_ class.
-        if cls.type in seg_type:
-            return True
-        # Have we reached the bottom?
-        elif cls.type == "base":
-            return False
-        # If not, check parent classes.
-        else:
-            return any(base_class.is_type(*seg_type) for base_class in cls.__bases__)
+        return not cls._class_types().isdisjoint(seg_type)
 
     @classmethod
     def structural_simplify(cls, elem):
@@ -425,6 +443,23 @@ class BaseSegment:
             return MatchResult((segments[0],), segments[1:])
 
         if cls.match_grammar:
+            # If the match grammar is simple, we can check the first code
+            # token against the simple options directly and reject without
+            # invoking the full grammar machinery. Any simple matcher which
+            # would match here must match on that first token.
+            simple = cls.simple(parse_context=parse_context)
+            if simple is not None:
+                first_code = None
+                for seg in segments:
+                    for raw_seg in seg.iter_raw_seg():
+                        if raw_seg.is_code:
+                            first_code = raw_seg
+                            break
+                    if first_code:
+                        break
+                if first_code is None or first_code.raw_upper not in simple:
+                    return MatchResult.from_unmatched(segments)
+
             # Call the private method
             with parse_context.deeper_match() as ctx:
                 m = cls.match_grammar.match(segments=segments, parse_context=ctx)
@@ -616,9 +651,23 @@ class BaseSegment:
         return buff
 
     def iter_raw_seg(self):
-        """Iterate raw segments, mostly for searching."""
-        for s in self.segments:
-            yield from s.iter_raw_seg()
+        """Iterate raw segments, mostly for searching.
+
+        NB: This is implemented with an explicit stack rather than
+        recursive generators, because nested `yield from` re-yields
+        each raw segment once per level of nesting, which is wasteful
+        on deep trees for such a hot method.
+        """
+        stack = [iter(self.segments)]
+        while stack:
+            for s in stack[-1]:
+                if s.segments:
+                    stack.append(iter(s.segments))
+                    break
+                else:
+                    yield s
+            else:
+                stack.pop()
 
     def iter_segments(self, expanding=None, pass_through=False):
         """Iterate raw segments, optionally expanding some chldren."""
@@ -66,7 +66,9 @@ class _ProtoKeywordSegment(RawSegment):
         if len(segments) >= 1:
             raw = segments[0].raw
             pos = segments[0].pos_marker
-            raw_comp = raw.upper()
+            # NB: We use the segment's precomputed raw_upper rather than
+            # upper-casing the raw afresh on every attempt.
+            raw_comp = segments[0].raw_upper
 
             # Is the target a match and IS IT CODE.
             # The latter stops us accidentally matching comments.
@@ -131,8 +133,9 @@ class ReSegment(_ProtoKeywordSegment):
         # Regardless of what we're passed, make a string.
         # NB: We only match on the first element of a set of segments.
         s = segments[0].raw
-        # Case sensitivity is not supported
-        sc = s.upper()
+        # Case sensitivity is not supported. Use the segment's
+        # precomputed raw_upper rather than upper-casing here.
+        sc = segments[0].raw_upper
         if len(s) == 0:
             raise ValueError("Zero length string passed to ReSegment!?")
         # Try the regex
@@ -186,8 +189,10 @@ class NamedSegment(_ProtoKeywordSegment):
         # We only match on the first element of a set of segments
         if len(segments) >= 1:
             s = segments[0]
-            # Case sensitivity is not supported.
-            n = s.name.upper()
+            # Case sensitivity is not supported. Lexer-generated classes
+            # carry a precomputed uppercase name; anything else (unusual
+            # here) falls back to upper-casing on the fly.
+            n = s._name_upper or s.name.upper()
             if cls._template == n:
                 m = (
                     cls(raw=s.raw, pos_marker=segments[0].pos_marker),
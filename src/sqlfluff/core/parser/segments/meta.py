@@ -84,8 +84,13 @@ class MetaSegment(RawSegment):
         ok in this sense. We need the pos marker later for dealing
         with repairs.
         """
-        self._raw = ""
-        self._raw_upper = ""
+        # Set the attributes which RawSegment.__init__ would
+        # otherwise derive from the raw content.
+        self.raw = ""
+        self.raw_upper = ""
+        self.matched_length = 0
+        self.is_code = self._is_code
+        self.is_comment = self._is_comment
         # We strip the position marker, so that when fixing it's
         # skipped and not considered. If no position marker is given
         # then give it a fresh one - it will need to be realigned
@@ -4,6 +4,8 @@ This is designed to be the root segment, without
 any children, and the output of the lexer.
 """
 
+from sys import intern
+
 from sqlfluff.core.parser.segments.base import BaseSegment
 
 
@@ -16,8 +18,19 @@ class RawSegment(BaseSegment):
     _template = "<unset>"
 
     def __init__(self, raw, pos_marker):
-        self._raw = raw
-        self._raw_upper = raw.upper()
+        # For a raw segment all of these are fixed at construction, so
+        # they're plain instance attributes rather than the properties
+        # (or cached properties) used on BaseSegment. Attribute access
+        # is measurably cheaper on a class this hot.
+        self.raw = raw
+        # Intern the uppercase form. Most raw segments are keywords,
+        # symbols or whitespace, so the same few strings recur
+        # constantly and interning makes the string comparisons in
+        # matching (and simple pruning) pointer comparisons.
+        self.raw_upper = intern(raw.upper())
+        self.matched_length = len(raw)
+        self.is_code = self._is_code
+        self.is_comment = self._is_comment
         # pos marker is required here
         self.pos_marker = pos_marker
 
@@ -28,31 +41,11 @@ class RawSegment(BaseSegment):
 
     # ################ PUBLIC PROPERTIES
 
-    @property
-    def matched_length(self):
-        """Return the length of the segment in characters."""
-        return len(self._raw)
-
     @property
     def is_expandable(self):
         """Return true if it is meaningful to call `expand` on this segment."""
         return False
 
-    @property
-    def is_code(self):
-        """Return True if this segment is code."""
-        return self._is_code
-
-    @property
-    def is_comment(self):
-        """Return True if this segment is a comment."""
-        return self._is_comment
-
-    @property
-    def raw_upper(self):
-        """Make an uppercase string from the segments of this segment."""
-        return self._raw_upper
-
     @property
     def segments(self):
         """Return an empty list of child segments.
@@ -63,24 +56,65 @@ class RawSegment(BaseSegment):
 
     # ################ CLASS METHODS
 
+    # A cache of the classes generated by `make`, because identical
+    # classes are requested repeatedly (particularly during dialect
+    # expansion) and generating a class is much more expensive than a
+    # dict lookup. NB: The parent class is part of the key, so
+    # subclasses sharing this attribute is fine.
+    _make_cache = {}
+
     @classmethod
     def make(cls, template, case_sensitive=False, name=None, **kwargs):
         """Make a subclass of the segment using a method."""
-        # Let's deal with the template first
+        cache_key = None
+        try:
+            cache_key = (
+                cls,
+                template,
+                case_sensitive,
+                name,
+                tuple(sorted(kwargs.items())),
+            )
+            return cls._make_cache[cache_key]
+        except TypeError:
+            # One of the kwargs isn't hashable. Unusual, but in that
+            # case just generate the class without caching.
+            cache_key = None
+        except KeyError:
+            pass
+        # Let's deal with the template first. Interning the template
+        # means matching against interned raw content can shortcut on
+        # identity.
         if case_sensitive:
-            _template = template
+            _template = intern(template)
         else:
-            _template = template.upper()
+            _template = intern(template.upper())
         # Use the name if provided otherwise default to the template
         name = name or _template
+        # Normalise the two spellings of the code/comment flags. Lexer
+        # configs pass is_code/is_comment, but the instance attributes
+        # are derived from the underscore class attributes.
+        for flag in ("is_code", "is_comment"):
+            if flag in kwargs:
+                kwargs["_" + flag] = kwargs.pop(flag)
         # Now lets make the classname (it indicates the mother class for clarity)
         classname = "{0}_{1}".format(name, cls.__name__)
         # This is the magic, we generate a new class! SORCERY
         newclass = type(
             classname,
             (cls,),
-            dict(_template=_template, _name=name, **kwargs),
+            # NB: We also stash the uppercase name on the class, so that
+            # name-based matching (see NamedSegment) doesn't have to
+            # upper-case it on every attempt.
+            dict(
+                _template=_template,
+                _name=name,
+                _name_upper=intern(name.upper()),
+                **kwargs,
+            ),
         )
+        if cache_key is not None:
+            cls._make_cache[cache_key] = newclass
         # Now we return that class in the abstract. NOT INSTANTIATED
         return newclass
 
@@ -91,7 +125,15 @@ class RawSegment(BaseSegment):
         yield self
 
     def raw_trimmed(self):
-        """Return a trimmed version of the raw content."""
+        """Return a trimmed version of the raw content.
+
+        The raw content of a segment never changes, so the trimmed form
+        is computed on first call and cached for any repeat calls (e.g.
+        reference rules which re-inspect the same identifiers).
+        """
+        cached = self.__dict__.get("_raw_trimmed")
+        if cached is not None:
+            return cached
         raw_buff = self.raw
         if self.trim_start:
             for seq in self.trim_start:
@@ -107,7 +149,7 @@ class RawSegment(BaseSegment):
                 # trim end
                 while raw_buff.endswith(seq):
                     raw_buff = raw_buff[: -len(seq)]
-            return raw_buff
+        self._raw_trimmed = raw_buff
         return raw_buff
 
     def raw_list(self):
@@ -116,7 +158,16 @@ class RawSegment(BaseSegment):
 
     def _reconstruct(self):
         """Return a string of the raw content of this segment."""
-        return self._raw
+        return self.raw
+
+    def invalidate_caches(self):
+        """Invalidate any cached properties.
+
+        A raw segment's content never changes (fixes create new
+        segments via `edit`), and the attributes which BaseSegment
+        caches are plain attributes here, so there's nothing to do.
+        """
+        pass
 
     def stringify(self, ident=0, tabsize=4, code_only=False):
         """Use indentation to render this segment and its children as a string."""